@@ -5,11 +5,11 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from PySide6 import QtWidgets, QtGui
+from PySide6 import QtCore, QtWidgets, QtGui
 
-from .models import StockTableModel, PartsTableModel
+from .models import StockTableModel, PartsTableModel, PlanTableModel
 from .io_utils import load_stock_table, load_parts_table, export_plan_csv, export_plan_pdf
-from .optimizer import optimize_cut_order, OptimizeResult, u_to_mm_str, SCALE
+from .optimizer import optimize_cut_order, OptimizeResult, format_part, SCALE
 
 def _icon_path() -> Path:
     # Works in dev and in PyInstaller onefile/onedir builds
@@ -18,6 +18,31 @@ def _icon_path() -> Path:
         return base / "cut_optimizer" / "assets" / "app_icon.png"
     return Path(__file__).resolve().parent / "assets" / "app_icon.png"
 
+class _ExportSignals(QtCore.QObject):
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+
+
+class _PdfExportTask(QtCore.QRunnable):
+    """Runs export_plan_pdf on the global thread pool so the UI stays responsive."""
+
+    def __init__(self, path: str, result: OptimizeResult, kerf_u: int, title: str) -> None:
+        super().__init__()
+        self.signals = _ExportSignals()
+        self._path = path
+        self._result = result
+        self._kerf_u = kerf_u
+        self._title = title
+
+    def run(self) -> None:
+        try:
+            export_plan_pdf(self._path, self._result, kerf_u=self._kerf_u, title=self._title)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self._path)
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -34,6 +59,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.kerf_spin.setSingleStep(0.1)
         self.kerf_spin.setValue(2.8)
         self.kerf_spin.setSuffix(" mm")
+        self._recompute_kerf_u(self.kerf_spin.value())
+        self.kerf_spin.valueChanged.connect(self._recompute_kerf_u)
 
         self.status_box = QtWidgets.QPlainTextEdit()
         self.status_box.setReadOnly(True)
@@ -48,11 +75,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.parts_view.horizontalHeader().setStretchLastSection(True)
         self.parts_view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
 
-        self.plan_view = QtWidgets.QTableWidget()
-        self.plan_view.setColumnCount(6)
-        self.plan_view.setHorizontalHeaderLabels(
-            ["Stick #", "Stock (mm)", "Cuts (mm + label)", "Used (mm)", "Leftover (mm)", "Util (%)"]
-        )
+        self.plan_model = PlanTableModel()
+        self.plan_view = QtWidgets.QTableView()
+        self.plan_view.setModel(self.plan_model)
         self.plan_view.horizontalHeader().setStretchLastSection(True)
         self.plan_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
 
@@ -123,6 +148,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._last_result: Optional[OptimizeResult] = None
         self._parts_source_path: Optional[str] = None
+        self._pdf_task: Optional[_PdfExportTask] = None
+        self._pdf_progress: Optional[QtWidgets.QProgressDialog] = None
 
         self.btn_load_stock.clicked.connect(self.on_load_stock)
         self.btn_load_parts.clicked.connect(self.on_load_parts)
@@ -134,6 +161,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_export.clicked.connect(self.on_export)
         self.btn_export_pdf.clicked.connect(self.on_export_pdf)
 
+    def _recompute_kerf_u(self, value: float) -> None:
+        # Kerf in internal 0.1mm units, kept in sync with the spin box.
+        self._kerf_u = int(round(float(value) * SCALE))
+
     def log(self, msg: str) -> None:
         self.status_box.appendPlainText(msg)
 
@@ -213,33 +244,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._last_result = result
         self.btn_export.setEnabled(True)
-        self.btn_export_pdf.setEnabled(True)
-        self.render_result(result, kerf)
-
-    def render_result(self, result: OptimizeResult, kerf_mm: float) -> None:
-        kerf_u = int(round(float(kerf_mm) * SCALE))
-
-        self.plan_view.setRowCount(0)
-        for i, plan in enumerate(result.plans, start=1):
-            used_u = plan.used_u(kerf_u)
-            left_u = plan.leftover_u(kerf_u)
-            util = (used_u / plan.stock_length_u * 100.0) if plan.stock_length_u else 0.0
-
-            def fmt_part(p):
-                mm = u_to_mm_str(p.length_u)
-                return f"{mm} {p.label}".strip()
-
-            cuts_str = "; ".join(fmt_part(p) for p in plan.parts)
-
-            row = self.plan_view.rowCount()
-            self.plan_view.insertRow(row)
-            self.plan_view.setItem(row, 0, QtWidgets.QTableWidgetItem(str(i)))
-            self.plan_view.setItem(row, 1, QtWidgets.QTableWidgetItem(u_to_mm_str(plan.stock_length_u)))
-            self.plan_view.setItem(row, 2, QtWidgets.QTableWidgetItem(cuts_str))
-            self.plan_view.setItem(row, 3, QtWidgets.QTableWidgetItem(u_to_mm_str(used_u)))
-            self.plan_view.setItem(row, 4, QtWidgets.QTableWidgetItem(u_to_mm_str(left_u)))
-            self.plan_view.setItem(row, 5, QtWidgets.QTableWidgetItem(f"{util:.2f}"))
+        # Stays disabled while a PDF export is running; _finish_pdf_export re-enables it.
+        self.btn_export_pdf.setEnabled(self._pdf_task is None)
+        self.render_result(result, self._kerf_u)
 
+    def render_result(self, result: OptimizeResult, kerf_u: int) -> None:
+        self.plan_model.set_result(result, kerf_u)
         self.plan_view.resizeColumnsToContents()
 
         self.status_box.clear()
@@ -251,41 +261,63 @@ class MainWindow(QtWidgets.QMainWindow):
             self.log("")
             self.log("UNALLOCATED parts:")
             for p in result.unallocated_parts:
-                self.log(f"  - {u_to_mm_str(p.length_u)} {p.label}".strip())
+                self.log(f"- {format_part(p)}")
 
     def on_export(self) -> None:
         if not self._last_result:
             return
-        kerf = float(self.kerf_spin.value())
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self, "Export Plan CSV", self._default_export_path(".csv"), "CSV (*.csv)"
         )
         if not path:
             return
         try:
-            export_plan_csv(path, self._last_result, kerf)
-            QtWidgets.QMessageBox.information(
-                self,
-                "Exported",
-                f"Exported:\n{path}\n\nAlso wrote:\n{path}.summary.csv\n{path}.unallocated.csv (may be empty)",
-            )
+            written = export_plan_csv(path, self._last_result, kerf_u=self._kerf_u)
+            also = "\n".join(written[1:])
+            QtWidgets.QMessageBox.information(self, "Exported", f"Exported:\n{path}\n\nAlso wrote:\n{also}")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Export error", str(e))
 
     def on_export_pdf(self) -> None:
-        if not self._last_result:
+        # One export at a time: the task's finish handler owns the dialog and _pdf_task.
+        if not self._last_result or self._pdf_task is not None:
             return
-        kerf = float(self.kerf_spin.value())
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self, "Export Plan PDF", self._default_export_path(".pdf"), "PDF (*.pdf)"
         )
         if not path:
             return
-        try:
-            export_plan_pdf(path, self._last_result, kerf, title=self._pdf_title())
-            QtWidgets.QMessageBox.information(self, "Exported", f"Exported:\n{path}")
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Export error", str(e))
+
+        progress = QtWidgets.QProgressDialog("Exporting PDF…", None, 0, 0, self)
+        progress.setWindowTitle("Export Plan (PDF)")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        self._pdf_progress = progress
+
+        task = _PdfExportTask(path, self._last_result, self._kerf_u, self._pdf_title())
+        task.signals.finished.connect(self._on_pdf_exported)
+        task.signals.failed.connect(self._on_pdf_export_failed)
+        self._pdf_task = task
+        self.btn_export_pdf.setEnabled(False)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _finish_pdf_export(self) -> None:
+        if self._pdf_progress is not None:
+            # Esc only hides the dialog, and a closed one stays parented to the window.
+            self._pdf_progress.close()
+            self._pdf_progress.deleteLater()
+        self._pdf_progress = None
+        self._pdf_task = None
+        self.btn_export_pdf.setEnabled(self._last_result is not None)
+
+    def _on_pdf_exported(self, path: str) -> None:
+        self._finish_pdf_export()
+        QtWidgets.QMessageBox.information(self, "Exported", f"Exported:\n{path}")
+
+    def _on_pdf_export_failed(self, msg: str) -> None:
+        self._finish_pdf_export()
+        QtWidgets.QMessageBox.critical(self, "Export error", msg)
 
 
 def main() -> int:
@@ -1,20 +1,103 @@
 from __future__ import annotations
 
-from typing import List
+import csv
+import os
+import sys
+from importlib.util import find_spec
+from typing import Any, Iterable, List, Sequence, Tuple
+import numpy as np
 import pandas as pd
 
-from .optimizer import StockItem, PartItem, OptimizeResult, u_to_mm_str, SCALE, round_up_to_half_mm
+from .optimizer import StockItem, PartItem, OptimizeResult, format_cuts, plan_stats, u_to_mm_str, SCALE, HALF_MM_U, SNAP_PER_U
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; fall back to pandas for ingestion.
+    pl = None
+
+# Without polars, let pandas parse Excel through the Rust calamine reader when it is
+# installed; it is much faster and lighter than openpyxl (pandas' default).
+_PANDAS_EXCEL_ENGINE = "calamine" if find_spec("python_calamine") is not None else None
+
+# Cell text pandas reads as missing by default (read_csv/read_excel na_values), so the
+# polars path treats "NA", "None", "NaN", ... the same way.
+_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+PLAN_CSV_COLUMNS = ["stick_no", "stock_length_mm", "cuts", "used_mm", "leftover_mm", "utilization_pct"]
+
+
+def _float_column(col: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """A polars/pandas column as float64, plus a mask of its empty cells.
+
+    Cells that are present but not numbers come back as NaN with the mask unset.
+    """
+    if pl is not None and isinstance(col, pl.Series):
+        # Converted in polars; strings are stripped first, like float(str(v).strip()).
+        missing = col.is_null().to_numpy()
+        if col.dtype == pl.String:
+            col = col.str.strip_chars()
+        return col.cast(pl.Float64, strict=False).to_numpy(), missing
+    missing = col.isna().to_numpy()
+    return pd.to_numeric(col, errors="coerce").to_numpy(dtype=np.float64), missing
+
 
+def _parse_mm_column(col: Any, field: str) -> List[float]:
+    """Parse a column of numeric mm values from CSV/XLSX and round each up to 0.5mm.
 
-def _parse_mm(value, field: str) -> float:
-    """Parse a numeric mm value from CSV/XLSX and round up to 0.5mm."""
-    if pd.isna(value):
-        return 0.0
-    try:
-        mm = float(str(value).strip())
-    except Exception as e:
-        raise ValueError(f"Invalid {field} value: {value!r}") from e
-    return round_up_to_half_mm(mm)
+    Vectorized equivalent of round_up_to_half_mm(); missing cells become 0.
+    """
+    mm, missing = _float_column(col)
+    mm = np.where(missing, 0.0, mm)
+    # Same snap-then-ceil as round_up_to_half_mm; the divisions are exact on the
+    # integer-valued floats np.rint produces.
+    with np.errstate(over="ignore"):
+        snapped = np.rint(mm * (SCALE * SNAP_PER_U))
+    # NaN and infinite cells are invalid, and so are lengths too large to snap.
+    bad = ~np.isfinite(snapped)
+    if bad.any():
+        raise ValueError(f"Invalid {field} value: {col.to_list()[int(np.argmax(bad))]!r}")
+    u_tenth = np.ceil(snapped / SNAP_PER_U)
+    u_half = np.ceil(u_tenth / HALF_MM_U) * HALF_MM_U
+    return np.where(mm > 0, u_half / SCALE, 0.0).tolist()
+
+
+def _parse_qty_column(col: Any) -> List[int]:
+    qty, _ = _float_column(col)
+    # astype(np.int64) has no defined result for NaN, inf or out-of-range values.
+    bad = ~((qty >= -(2.0**63)) & (qty < 2.0**63))
+    if bad.any():
+        raise ValueError(f"Invalid qty value: {col.to_list()[int(np.argmax(bad))]!r}")
+    return qty.astype(np.int64).tolist()
+
+
+def _parse_label_column(col: Any) -> List[str]:
+    if pl is not None and isinstance(col, pl.Series) and col.dtype == pl.String:
+        values = col.fill_null("").to_list()
+    else:
+        # Numbers and mixed columns keep Python's str() formatting of each cell.
+        values = pd.Series(col.to_list(), dtype=object).fillna("").astype(str).tolist()
+    # Interned so rows that share a label share one string object.
+    return [sys.intern(s) for s in values]
 
 
 def load_stock_table(path: str) -> List[StockItem]:
@@ -22,10 +105,9 @@ def load_stock_table(path: str) -> List[StockItem]:
     df = _normalize_columns(df)
     if "stock_length" not in df.columns or "qty" not in df.columns:
         raise ValueError("Stock file must have columns: stock_length, qty")
-    items: List[StockItem] = []
-    for _, row in df.iterrows():
-        items.append(StockItem(length_mm=_parse_mm(row["stock_length"], "stock_length"), qty=int(row["qty"])))
-    return items
+    lengths = _parse_mm_column(df["stock_length"], "stock_length")
+    qtys = _parse_qty_column(df["qty"])
+    return [StockItem(length_mm=v, qty=q) for v, q in zip(lengths, qtys)]
 
 
 def load_parts_table(path: str) -> List[PartItem]:
@@ -33,51 +115,60 @@ def load_parts_table(path: str) -> List[PartItem]:
     df = _normalize_columns(df)
     if "part_length" not in df.columns or "qty" not in df.columns:
         raise ValueError("Parts file must have columns: part_length, qty (optional: label)")
-    if "label" not in df.columns:
-        df["label"] = ""
-    items: List[PartItem] = []
-    for _, row in df.iterrows():
-        label = "" if pd.isna(row["label"]) else str(row["label"])
-        items.append(
-            PartItem(length_mm=_parse_mm(row["part_length"], "part_length"), qty=int(row["qty"]), label=label)
-        )
-    return items
+    lengths = _parse_mm_column(df["part_length"], "part_length")
+    qtys = _parse_qty_column(df["qty"])
+    labels = _parse_label_column(df["label"]) if "label" in df.columns else [""] * len(lengths)
+    return [PartItem(length_mm=v, qty=q, label=lb) for v, q, lb in zip(lengths, qtys, labels)]
 
 
-def export_plan_csv(path: str, result: OptimizeResult, kerf_mm: float) -> None:
-    kerf_u = int(round(float(kerf_mm) * SCALE))
+def export_plan_csv(path: str, result: OptimizeResult, *, kerf_u: int) -> List[str]:
+    """Write the plan CSV plus its .summary.csv / .unallocated.csv sidecars.
 
-    rows = []
-    for i, plan in enumerate(result.plans, start=1):
-        used_u = plan.used_u(kerf_u)
-        left_u = plan.leftover_u(kerf_u)
-        util = (used_u / plan.stock_length_u * 100.0) if plan.stock_length_u else 0.0
-
-        def fmt_part(p):
-            mm = u_to_mm_str(p.length_u)
-            return f"{mm} {p.label}".strip()
+    kerf_u is the kerf in internal 0.1mm units (mm_to_u(kerf_mm)), not mm; it is
+    keyword-only so a caller still passing kerf in mm fails instead of silently
+    getting a tenth of the kerf. Returns the paths that were written.
+    """
+    used, left, util = (a.tolist() for a in plan_stats(result.plans, kerf_u))
 
+    rows = []
+    for i, plan in enumerate(result.plans):
         rows.append(
-            {
-                "stick_no": i,
-                "stock_length_mm": u_to_mm_str(plan.stock_length_u),
-                "cuts": "; ".join(fmt_part(p) for p in plan.parts),
-                "used_mm": u_to_mm_str(used_u),
-                "leftover_mm": u_to_mm_str(left_u),
-                "utilization_pct": round(util, 2),
-            }
+            (
+                i + 1,
+                u_to_mm_str(plan.stock_length_u),
+                format_cuts(plan),
+                u_to_mm_str(used[i]),
+                u_to_mm_str(left[i]),
+                round(util[i], 2),
+            )
         )
 
-    pd.DataFrame(rows).to_csv(path, index=False)
-    pd.DataFrame([result.summary]).to_csv(path + ".summary.csv", index=False)
+    summary_path = path + ".summary.csv"
+    _write_csv(path, PLAN_CSV_COLUMNS, rows)
+    _write_csv(summary_path, list(result.summary.keys()), [list(result.summary.values())])
+    written = [path, summary_path]
+
+    # Only write the unallocated CSV when there is something in it, but remove any
+    # file left by a previous export so we never leave stale data on disk.
+    unalloc_path = path + ".unallocated.csv"
+    if result.unallocated_parts:
+        unalloc_rows = [(u_to_mm_str(p.length_u), p.label) for p in result.unallocated_parts]
+        _write_csv(unalloc_path, ["part_length_mm", "label"], unalloc_rows)
+        written.append(unalloc_path)
+    elif os.path.exists(unalloc_path):
+        os.remove(unalloc_path)
+    return written
+
 
-    # Always write the unallocated CSV, even when empty, so we never leave stale
-    # data from a previous export on disk.
-    unalloc_rows = [{"part_length_mm": u_to_mm_str(p.length_u), "label": p.label} for p in result.unallocated_parts]
-    pd.DataFrame(unalloc_rows, columns=["part_length_mm", "label"]).to_csv(path + ".unallocated.csv", index=False)
+def _write_csv(path: str, header: List[str], rows: Iterable[Sequence[Any]]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        # os.linesep, like DataFrame.to_csv wrote: CRLF on Windows, LF elsewhere.
+        w = csv.writer(f, lineterminator=os.linesep)
+        w.writerow(header)
+        w.writerows(rows)
 
 
-def export_plan_pdf(path: str, result: OptimizeResult, kerf_mm: float, *, title: str = "Cut plan") -> None:
+def export_plan_pdf(path: str, result: OptimizeResult, *, kerf_u: int, title: str = "Cut plan") -> None:
     """Export a multi-page PDF cut plan.
 
     The PDF uses a dynamic layout:
@@ -87,25 +178,47 @@ def export_plan_pdf(path: str, result: OptimizeResult, kerf_mm: float, *, title:
       - if sticks exceed page width, they wrap into a new block below
       - multiple pages are created automatically
 
-    This wrapper keeps the public API stable and delegates drawing to
+    kerf_u is the kerf in internal 0.1mm units (mm_to_u(kerf_mm)), not mm, and is
+    keyword-only as in export_plan_csv. Drawing is delegated to
     cut_optimizer.pdf_export.export_plan_pdf.
     """
     from .pdf_export import export_plan_pdf as _export
 
-    _export(path, result, kerf_mm, title=title)
+    _export(path, result, kerf_u=kerf_u, title=title)
 
 
 
-def _read_table(path: str) -> pd.DataFrame:
+def _read_table(path: str) -> Any:
+    """Read a CSV/XLSX file into a polars DataFrame (or pandas if polars is missing)."""
     p = path.lower()
     if p.endswith(".csv"):
-        return pd.read_csv(path)
-    if p.endswith(".xlsx") or p.endswith(".xls"):
-        return pd.read_excel(path)
-    raise ValueError("Unsupported file type. Use .csv or .xlsx")
-
-
-def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df.columns = [str(c).strip().lower() for c in df.columns]
+        if pl is None:
+            return pd.read_csv(path)
+        # polars infers column types from a sample of leading rows, so a decimal or
+        # text value further down would fail the read. The column parsers coerce
+        # every value themselves, so read everything as text.
+        df = pl.read_csv(path, infer_schema=False, null_values=_NA_VALUES)
+    elif p.endswith(".xlsx") or p.endswith(".xls"):
+        if pl is None:
+            return pd.read_excel(path, engine=_PANDAS_EXCEL_ENGINE)
+        # Infer from every row, not a sample: a later text value would be dropped.
+        df = pl.read_excel(path, engine="calamine", infer_schema_length=None)
+        # calamine itself reads some NA text ("NaN") into float columns as NaN.
+        text = pl.col(pl.String)
+        df = df.with_columns(
+            pl.when(text.is_in(_NA_VALUES)).then(None).otherwise(text).name.keep(),
+            pl.col(pl.Float32, pl.Float64).fill_nan(None),
+        )
+    else:
+        raise ValueError("Unsupported file type. Use .csv or .xlsx")
+    # pandas skips blank lines; polars reads them as rows of nulls.
+    return df.filter(~pl.all_horizontal(pl.all().is_null()))
+
+
+def _normalize_columns(df: Any) -> Any:
+    if pl is not None and isinstance(df, pl.DataFrame):
+        return df.rename({c: str(c).strip().lower() for c in df.columns})
+    # _read_table hands us a fresh frame, so rename in place: assigning a new
+    # Index does not copy the column data the way df.copy() did.
+    df.columns = pd.Index([str(c).strip().lower() for c in df.columns])
     return df
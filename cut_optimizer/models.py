@@ -1,18 +1,42 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 from PySide6 import QtCore
 
-from .optimizer import StockItem, PartItem, round_up_to_half_mm
+from .optimizer import (
+    OptimizeResult,
+    PartItem,
+    StickPlan,
+    StockItem,
+    format_cuts,
+    plan_stats,
+    round_up_to_half_mm,
+    u_to_mm_str,
+)
 
 
+@lru_cache(maxsize=4096)
 def _fmt_mm(mm: float) -> str:
     # Display mm values without trailing .0
+    # Cached: data() runs on every repaint and the row values are immutable.
     if abs(mm - round(mm)) < 1e-9:
         return str(int(round(mm)))
     return f"{mm:.1f}".rstrip("0").rstrip(".")
 
 
+def _descending_runs(row_indices: List[int], n_rows: int) -> List[Tuple[int, int]]:
+    # Valid row indices coalesced into contiguous (first, last) runs, last run first,
+    # so each run can be removed with one begin/endRemoveRows pair.
+    runs: List[Tuple[int, int]] = []
+    for r in sorted({r for r in row_indices if 0 <= r < n_rows}, reverse=True):
+        if runs and runs[-1][0] == r + 1:
+            runs[-1] = (r, runs[-1][1])
+        else:
+            runs.append((r, r))
+    return runs
+
+
 class StockTableModel(QtCore.QAbstractTableModel):
     HEADERS = ["stock_length (mm) (rounded up to 0.5mm)", "qty"]
 
@@ -65,6 +89,9 @@ class StockTableModel(QtCore.QAbstractTableModel):
             self._rows[r] = StockItem(length_mm=row.length_mm, qty=max(0, iv))
         else:
             return False
+        if self._rows[r] == row:
+            # Same value committed again (or one that rounds to it): nothing to repaint.
+            return True
         self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
         return True
 
@@ -76,17 +103,25 @@ class StockTableModel(QtCore.QAbstractTableModel):
     def rows(self) -> List[StockItem]:
         return list(self._rows)
 
+    def extend_rows(self, new_rows: List[StockItem]) -> None:
+        # Append many rows under a single insert notification.
+        if not new_rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+
     def add_row(self) -> None:
         self.beginInsertRows(QtCore.QModelIndex(), len(self._rows), len(self._rows))
         self._rows.append(StockItem(length_mm=0, qty=0))
         self.endInsertRows()
 
     def remove_rows(self, row_indices: List[int]) -> None:
-        for r in sorted(set(row_indices), reverse=True):
-            if 0 <= r < len(self._rows):
-                self.beginRemoveRows(QtCore.QModelIndex(), r, r)
-                self._rows.pop(r)
-                self.endRemoveRows()
+        for first, last in _descending_runs(row_indices, len(self._rows)):
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._rows[first : last + 1]
+            self.endRemoveRows()
 
 
 class PartsTableModel(QtCore.QAbstractTableModel):
@@ -149,6 +184,9 @@ class PartsTableModel(QtCore.QAbstractTableModel):
             self._rows[r] = PartItem(length_mm=row.length_mm, qty=row.qty, label=str(value))
         else:
             return False
+        if self._rows[r] == row:
+            # Same value committed again (or one that rounds to it): nothing to repaint.
+            return True
         self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
         return True
 
@@ -160,14 +198,101 @@ class PartsTableModel(QtCore.QAbstractTableModel):
     def rows(self) -> List[PartItem]:
         return list(self._rows)
 
+    def extend_rows(self, new_rows: List[PartItem]) -> None:
+        # Append many rows under a single insert notification.
+        if not new_rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+
     def add_row(self) -> None:
         self.beginInsertRows(QtCore.QModelIndex(), len(self._rows), len(self._rows))
         self._rows.append(PartItem(length_mm=0, qty=0, label=""))
         self.endInsertRows()
 
     def remove_rows(self, row_indices: List[int]) -> None:
-        for r in sorted(set(row_indices), reverse=True):
-            if 0 <= r < len(self._rows):
-                self.beginRemoveRows(QtCore.QModelIndex(), r, r)
-                self._rows.pop(r)
-                self.endRemoveRows()
+        for first, last in _descending_runs(row_indices, len(self._rows)):
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._rows[first : last + 1]
+            self.endRemoveRows()
+
+
+class PlanTableModel(QtCore.QAbstractTableModel):
+    """Read-only view of an OptimizeResult.
+
+    Cell text is formatted on first request and cached per row, so repaints and
+    scrolling don't rebuild the cuts string.
+    """
+
+    HEADERS = ["Stick #", "Stock (mm)", "Cuts (mm + label)", "Used (mm)", "Leftover (mm)", "Util (%)"]
+
+    def __init__(self, result: Optional[OptimizeResult] = None, kerf_u: int = 0) -> None:
+        super().__init__()
+        self._result: Optional[OptimizeResult] = None
+        self._kerf_u = kerf_u
+        self._plans: List[StickPlan] = []
+        self._used: List[int] = []
+        self._left: List[int] = []
+        self._util: List[float] = []
+        self._texts: List[Optional[Tuple[str, ...]]] = []
+        if result is not None:
+            self.set_result(result, kerf_u)
+
+    def set_result(self, result: OptimizeResult, kerf_u: int) -> None:
+        """Show a new result; a repeat call with the same result and kerf keeps the cached text."""
+        if result is self._result and kerf_u == self._kerf_u:
+            return
+        self.beginResetModel()
+        self._result = result
+        self._kerf_u = kerf_u
+        self._plans = result.plans
+        used, left, util = plan_stats(self._plans, kerf_u)
+        self._used = used.tolist()
+        self._left = left.tolist()
+        self._util = util.tolist()
+        self._texts = [None] * len(self._plans)
+        self.endResetModel()
+
+    def _row_texts(self, r: int) -> Tuple[str, ...]:
+        texts = self._texts[r]
+        if texts is None:
+            plan = self._plans[r]
+            texts = (
+                str(r + 1),
+                u_to_mm_str(plan.stock_length_u),
+                format_cuts(plan),
+                u_to_mm_str(self._used[r]),
+                u_to_mm_str(self._left[r]),
+                f"{self._util[r]:.2f}",
+            )
+            self._texts[r] = texts
+        return texts
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return len(self._plans)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        if orientation == QtCore.Qt.Vertical:
+            return section + 1
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role != QtCore.Qt.DisplayRole or not index.isValid() or not (0 <= index.row() < len(self._plans)):
+            return None
+        if not (0 <= index.column() < len(self.HEADERS)):
+            return None
+        return self._row_texts(index.row())[index.column()]
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
-import math
-from collections import Counter
-from typing import List, Dict, Optional
+from functools import lru_cache
+import sys
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy DP is used without it.
+    njit = None
 
 # Internally we compute in 0.1mm units to support kerf values like 2.8mm exactly.
 SCALE = 10  # 1mm = 10 units (0.1mm per unit)
@@ -20,6 +28,11 @@ HALF_MM_U = 5
 SMALL_STOCK_KNAPSACK_MAX_MM = 4000
 
 
+# round_up_to_half_mm snaps to a millionth of a unit before taking the ceiling, so
+# float noise such as 1000.1 * 10 == 10001.000000000002 doesn't push a value up.
+SNAP_PER_U = 1_000_000
+
+
 def round_up_to_half_mm(mm: float) -> float:
     """Round *up* to the next 0.5mm boundary.
 
@@ -33,10 +46,11 @@ def round_up_to_half_mm(mm: float) -> float:
         return 0.0
 
     # Convert to internal 0.1mm units, rounding *up* to the next 0.1mm,
-    # then round *up* again to the next 0.5mm boundary.
-    eps = 1e-9
-    u_tenth = int(math.ceil(float(mm) * SCALE - eps))
-    u_half = int(math.ceil(u_tenth / HALF_MM_U) * HALF_MM_U)
+    # then round *up* again to the next 0.5mm boundary. Integer ceiling
+    # division throughout, after one round() onto the snap grid.
+    snapped = round(float(mm) * (SCALE * SNAP_PER_U))
+    u_tenth = -(-snapped // SNAP_PER_U)
+    u_half = -(-u_tenth // HALF_MM_U) * HALF_MM_U
     return u_half / SCALE
 
 
@@ -44,8 +58,10 @@ def mm_to_u(mm: float) -> int:
     """Convert mm (may include .5 increments) to internal 0.1mm units."""
     return int(round(float(mm) * SCALE))
 
+@lru_cache(maxsize=4096)
 def u_to_mm_str(u: int) -> str:
-    # Render tenths-mm units as a human-friendly mm string (no trailing .0)
+    # Render tenths-mm units as a human-friendly mm string (no trailing .0).
+    # Cached: plans repeat the same few stock/part lengths over and over.
     if u % SCALE == 0:
         return str(u // SCALE)
     return f"{u / SCALE:.1f}".rstrip("0").rstrip(".")
@@ -63,20 +79,31 @@ class PartItem:
     qty: int
     label: str = ""
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PartInstance:
+    # slots: no per-instance __dict__; plans hold one reference per physical part.
     length_u: int
     label: str = ""
 
+def format_part(part: PartInstance) -> str:
+    # "<length> <label>" as shown in the plan table and CSV cuts column.
+    return f"{u_to_mm_str(part.length_u)} {part.label}".strip()
+
 @dataclass
 class StickPlan:
     stock_length_u: int
     parts: List[PartInstance] = field(default_factory=list)
+    # Running sum of part lengths (no kerf), so used/leftover/can_add are O(1).
+    # Only valid while parts are added through add() / add_many().
+    _parts_u: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._parts_u = sum(p.length_u for p in self.parts)
 
     def used_u(self, kerf_u: int) -> int:
         if not self.parts:
             return 0
-        return sum(p.length_u for p in self.parts) + kerf_u * (len(self.parts) - 1)
+        return self._parts_u + kerf_u * (len(self.parts) - 1)
 
     def leftover_u(self, kerf_u: int) -> int:
         return self.stock_length_u - self.used_u(kerf_u)
@@ -90,6 +117,16 @@ class StickPlan:
 
     def add(self, part: PartInstance) -> None:
         self.parts.append(part)
+        self._parts_u += part.length_u
+
+    def add_many(self, part: PartInstance, n: int) -> None:
+        # n copies of one part, as the greedy places a whole row at once.
+        self.parts.extend([part] * n)
+        self._parts_u += part.length_u * n
+
+def format_cuts(plan: StickPlan) -> str:
+    # The "; "-joined cuts column. join() on a prebuilt list skips the generator overhead.
+    return "; ".join([format_part(p) for p in plan.parts])
 
 @dataclass
 class OptimizeResult:
@@ -97,12 +134,64 @@ class OptimizeResult:
     unallocated_parts: List[PartInstance]
     summary: Dict[str, float]
 
-def _expand_parts(parts: List[PartItem]) -> List[PartInstance]:
-    out: List[PartInstance] = []
+def plan_stats(plans: List[StickPlan], kerf_u: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Used length, leftover (both in units) and utilization % for every plan at once."""
+    n = len(plans)
+    sum_len = np.fromiter((plan._parts_u for plan in plans), dtype=np.int64, count=n)
+    n_parts = np.fromiter((len(plan.parts) for plan in plans), dtype=np.int64, count=n)
+    stock = np.fromiter((plan.stock_length_u for plan in plans), dtype=np.int64, count=n)
+    used = np.where(n_parts > 0, sum_len + (n_parts - 1) * kerf_u, 0)
+    left = stock - used
+    util = np.divide(used, stock, out=np.zeros(n), where=stock > 0) * 100.0
+    return used, left, util
+
+def _part_rows(parts: List[PartItem]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """Usable part rows as parallel arrays (length, qty, label id), in input order.
+
+    Parts are kept as rows with a quantity rather than one entry per physical part;
+    labels is the table of distinct labels that label_ids index into.
+    """
+    labels: List[str] = []
+    label_index: Dict[str, int] = {}
+    row_lengths: List[int] = []
+    row_qty: List[int] = []
+    row_labels: List[int] = []
     for p in parts:
         if p.qty > 0 and p.length_mm > 0:
-            out.extend([PartInstance(length_u=mm_to_u(p.length_mm), label=p.label or "")] * p.qty)
-    return out
+            label = sys.intern(p.label or "")
+            if label not in label_index:
+                label_index[label] = len(labels)
+                labels.append(label)
+            row_lengths.append(mm_to_u(p.length_mm))
+            row_qty.append(p.qty)
+            row_labels.append(label_index[label])
+    return (
+        np.asarray(row_lengths, dtype=np.int64),
+        np.asarray(row_qty, dtype=np.int64),
+        np.asarray(row_labels, dtype=np.int64),
+        labels,
+    )
+
+def _count_rows(counts: Dict[Tuple[int, str], int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    # _part_rows arrays for a {(length_u, label): qty} mapping, in key order.
+    labels = list(dict.fromkeys(label for _, label in counts))
+    label_index = {label: i for i, label in enumerate(labels)}
+    return (
+        np.fromiter((length_u for length_u, _ in counts), dtype=np.int64, count=len(counts)),
+        np.fromiter(counts.values(), dtype=np.int64, count=len(counts)),
+        np.fromiter((label_index[label] for _, label in counts), dtype=np.int64, count=len(counts)),
+        labels,
+    )
+
+def _sort_desc(
+    lengths_u: np.ndarray, qty: np.ndarray, label_ids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Longest first; the stable sort keeps equal lengths in input order.
+    if np.all(lengths_u[:-1] >= lengths_u[1:]):
+        # Already in order (e.g. a cut list exported longest first).
+        return lengths_u, qty, label_ids
+    order = np.argsort(-lengths_u, kind="stable")
+    return lengths_u[order], qty[order], label_ids[order]
 
 def _expand_stock(stock: List[StockItem]) -> List[int]:
     out: List[int] = []
@@ -112,19 +201,26 @@ def _expand_stock(stock: List[StockItem]) -> List[int]:
     return out
 
 def _pick_smallest_fitting_stock(available_stock_u: List[int], required_u: int) -> Optional[int]:
-    candidates = [L for L in available_stock_u if L >= required_u]
-    return min(candidates) if candidates else None
+    # Index of the shortest stick >= required_u; available_stock_u must be sorted ascending.
+    i = bisect_left(available_stock_u, required_u)
+    return i if i < len(available_stock_u) else None
 
 
 def _build_result(plans: List[StickPlan], unallocated: List[PartInstance], kerf_u: int) -> OptimizeResult:
+    # One pass: sort each stick's cuts and accumulate the totals.
+    total_stock_used_u = 0
+    total_parts_used_u = 0
+    total_cuts = 0
     for plan in plans:
         plan.parts.sort(key=lambda p: p.length_u, reverse=True)
+        total_stock_used_u += plan.stock_length_u
+        total_parts_used_u += plan._parts_u
+        if plan.parts:
+            total_cuts += len(plan.parts) - 1
 
-    total_stock_used_u = sum(p.stock_length_u for p in plans)
-    total_parts_used_u = sum(sum(pp.length_u for pp in p.parts) for p in plans)
-    total_kerf_loss_u = sum(max(0, len(p.parts) - 1) * kerf_u for p in plans)
+    total_kerf_loss_u = total_cuts * kerf_u
     total_used_with_kerf_u = total_parts_used_u + total_kerf_loss_u
-    total_leftover_u = sum(p.leftover_u(kerf_u) for p in plans)
+    total_leftover_u = total_stock_used_u - total_used_with_kerf_u
 
     utilization = (total_used_with_kerf_u / total_stock_used_u * 100.0) if total_stock_used_u else 0.0
 
@@ -145,96 +241,245 @@ def _build_result(plans: List[StickPlan], unallocated: List[PartInstance], kerf_
 def _place_parts_greedy(
     plans: List[StickPlan],
     available_stock_u: List[int],
-    parts_sorted_desc: List[PartInstance],
+    lengths_u: np.ndarray,
+    qty: np.ndarray,
+    label_ids: np.ndarray,
+    labels: List[str],
     kerf_u: int,
 ) -> List[PartInstance]:
-    """Place parts into existing plans and open new sticks from available_stock_u as needed."""
+    """Place parts into existing plans and open new sticks from available_stock_u as needed.
 
-    unallocated: List[PartInstance] = []
+    available_stock_u must be sorted ascending.
 
-    for part in parts_sorted_desc:
-        best_i: Optional[int] = None
-        best_leftover_after: Optional[int] = None
+    Parts come in as _part_rows arrays, sorted longest first. Each row is placed
+    with the same best-fit rule as placing its parts one at a time, but in bulk:
 
-        for i, plan in enumerate(plans):
-            if plan.can_add(part, kerf_u):
-                delta = part.length_u if not plan.parts else (kerf_u + part.length_u)
-                leftover_after = plan.leftover_u(kerf_u) - delta
-                if best_leftover_after is None or leftover_after < best_leftover_after:
-                    best_leftover_after = leftover_after
-                    best_i = i
+    - Best fit keeps choosing the same stick until it is full for this length
+      (its leftover only shrinks, so it stays the tightest fit).
+    - Once no open stick fits, none will for the rest of the row, so each new
+      stick takes as many parts as it can hold.
 
-        if best_i is not None:
-            plans[best_i].add(part)
-            continue
+    The best-fit scan over open sticks runs on parallel int64 arrays (stock length,
+    used length, part count, index into `plans`). A stick with less room left than
+    the shortest part still to come can never be chosen again, so it is retired:
+    marked as full, and dropped from the arrays once retired sticks make up half of
+    them. The survivors keep their order, so ties resolve exactly as before.
+    """
 
-        chosen = _pick_smallest_fitting_stock(available_stock_u, part.length_u)
-        if chosen is None:
-            unallocated.append(part)
-            continue
+    unallocated: List[PartInstance] = []
 
-        available_stock_u.remove(chosen)
-        plans.append(StickPlan(stock_length_u=chosen, parts=[part]))
+    n = len(plans)
+    cap = max(16, 2 * n)
+    stock_len = np.empty(cap, dtype=np.int64)
+    used = np.empty(cap, dtype=np.int64)
+    n_parts = np.empty(cap, dtype=np.int64)
+    plan_of = np.empty(cap, dtype=np.int64)
+    for i, plan in enumerate(plans):
+        stock_len[i] = plan.stock_length_u
+        used[i] = plan.used_u(kerf_u)
+        n_parts[i] = len(plan.parts)
+        plan_of[i] = i
+
+    no_fit = np.iinfo(np.int64).max
+
+    # Room a non-empty stick needs for the shortest part that will ever be scanned.
+    positive = lengths_u[lengths_u > 0]
+    min_room = int(positive.min()) + kerf_u if positive.size else 0
+    retired = 0
+
+    def retire_if_full(i: int) -> None:
+        nonlocal retired
+        if n_parts[i] > 0 and stock_len[i] - used[i] < min_room:
+            used[i] = stock_len[i]  # Leaves no room for any need > 0.
+            retired += 1
+
+    for i in range(n):
+        retire_if_full(i)
+
+    for length_u, left, label_id in zip(lengths_u.tolist(), qty.tolist(), label_ids.tolist()):
+        part = PartInstance(length_u=length_u, label=labels[label_id])
+        step = length_u + kerf_u
+
+        if retired * 2 > n:
+            keep = (used[:n] < stock_len[:n]) | (n_parts[:n] == 0)
+            k = int(keep.sum())
+            for arr in (stock_len, used, n_parts, plan_of):
+                arr[:k] = arr[:n][keep]
+            n = k
+            retired = 0
+
+        while left and n and length_u > 0:
+            need = np.where(n_parts[:n] > 0, step, length_u)
+            leftover_after = stock_len[:n] - used[:n] - need
+            leftover_after[leftover_after < 0] = no_fit
+            # argmin returns the first minimum, matching the old strict "<" scan.
+            best_i = int(leftover_after.argmin())
+            if leftover_after[best_i] == no_fit:
+                break
+            take = min(left, 1 + int(leftover_after[best_i]) // step)
+            plans[int(plan_of[best_i])].add_many(part, take)
+            used[best_i] += need[best_i] + step * (take - 1)
+            n_parts[best_i] += take
+            left -= take
+            retire_if_full(best_i)
+
+        while left:
+            stock_i = _pick_smallest_fitting_stock(available_stock_u, length_u)
+            if stock_i is None:
+                # Stock only gets shorter from here, so the rest of the row cannot fit either.
+                unallocated.extend([part] * left)
+                break
+
+            chosen = available_stock_u.pop(stock_i)
+            # A zero-length part never joins an open stick, so it gets a stick of its own.
+            take = min(left, 1 + (chosen - length_u) // step) if length_u > 0 else 1
+            plans.append(StickPlan(stock_length_u=chosen, parts=[part] * take))
+            left -= take
+
+            if n == cap:
+                cap *= 2
+                stock_len = np.resize(stock_len, cap)
+                used = np.resize(used, cap)
+                n_parts = np.resize(n_parts, cap)
+                plan_of = np.resize(plan_of, cap)
+            stock_len[n] = chosen
+            used[n] = length_u * take + kerf_u * (take - 1)
+            n_parts[n] = take
+            plan_of[n] = len(plans) - 1
+            retire_if_full(n)
+            n += 1
 
     return unallocated
 
 
-def _bounded_knapsack_max_fill(cap_u: int, weights_u: List[int], counts: List[int]) -> List[int]:
+def _knapsack_dp_numpy(
+    cap_u: int, split_w: np.ndarray, best: np.ndarray, prev_cap: np.ndarray, prev_item: np.ndarray
+) -> None:
+    """Fill the 0-1 knapsack DP tables for the binary-split items.
+
+    best[c] is the best fill reachable at capacity c (or -1); prev_cap/prev_item
+    record how each capacity was reached, for the backtrace. The tables are
+    caller-owned buffers of at least cap_u + 1 entries, reused across sticks.
+    """
+    best = best[: cap_u + 1]
+    best.fill(-1)
+    best[0] = 0
+    # prev_* needs no reset: the backtrace only visits capacities improved in this run.
+
+    # Each 0-1 item is a single vectorized sweep: the slice on the right is read
+    # before it is written, which is exactly the descending-capacity order of the
+    # scalar DP.
+    for idx, w in enumerate(split_w.tolist()):
+        if w > cap_u:
+            continue
+        src = best[: cap_u + 1 - w]
+        cand = np.where(src >= 0, src + w, -1)
+        improve = cand > best[w:]
+        if not improve.any():
+            continue
+        best[w:][improve] = cand[improve]
+        caps = np.flatnonzero(improve) + w
+        prev_cap[caps] = caps - w
+        prev_item[caps] = idx
+
+
+def _knapsack_dp_scalar(
+    cap_u: int, split_w: np.ndarray, best: np.ndarray, prev_cap: np.ndarray, prev_item: np.ndarray
+) -> None:
+    # Same tables as _knapsack_dp_numpy, written as the plain descending-capacity
+    # loop for numba to compile. Far too slow to run uncompiled.
+    best[: cap_u + 1] = -1
+    best[0] = 0
+
+    for idx in range(split_w.size):
+        w = split_w[idx]
+        for c in range(cap_u, w - 1, -1):
+            b = best[c - w]
+            if b == -1:
+                continue
+            v = b + w
+            if v > best[c]:
+                best[c] = v
+                prev_cap[c] = c - w
+                prev_item[c] = idx
+
+
+_knapsack_dp = _knapsack_dp_numpy
+_KNAPSACK_DTYPE = np.int64
+if njit is not None:
+    try:
+        # On-disk caching needs a writable __pycache__ locator, which a frozen
+        # (PyInstaller) build doesn't have; compile in memory there instead.
+        _knapsack_dp_nb = njit(cache=not getattr(sys, "frozen", False), boundscheck=False)(_knapsack_dp_scalar)
+        # Compile (or load the cached build) now rather than on the first Optimize click.
+        _knapsack_dp_nb(1, np.ones(1, dtype=np.int64), *(np.empty(2, dtype=np.int32) for _ in range(3)))
+    except Exception:  # a broken numba install must not stop the app; keep the NumPy DP.
+        pass
+    else:
+        _knapsack_dp = _knapsack_dp_nb
+        _KNAPSACK_DTYPE = np.int32
+
+
+def _knapsack_buffers(max_cap_u: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # best, prev_cap, prev_item tables for every cap_u <= max_cap_u.
+    return tuple(np.empty(max_cap_u + 1, dtype=_KNAPSACK_DTYPE) for _ in range(3))
+
+
+def _bounded_knapsack_max_fill(
+    cap_u: int,
+    weights_u: List[int],
+    counts: List[int],
+    buffers: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+) -> List[int]:
     """Bounded knapsack (exact DP) maximizing total weight <= cap_u.
 
-    Returns the chosen counts per type.
+    Returns the chosen counts per type. buffers (from _knapsack_buffers) lets a
+    caller solving many sticks reuse the DP tables instead of allocating them.
     """
 
     if cap_u <= 0 or not weights_u or not counts:
         return [0] * len(weights_u)
 
-    # Binary-split counts into 0-1 items.
-    split_w: List[int] = []
-    split_type: List[int] = []
-    split_qty: List[int] = []
+    # Binary-split counts into 0-1 items. A count c splits into c.bit_length() items
+    # (1, 2, 4, ..., remainder), so the arrays can be sized up front.
+    n_split = sum(int(c).bit_length() for w, c in zip(weights_u, counts) if w > 0 and c > 0)
+    if not n_split:
+        return [0] * len(weights_u)
+
+    split_w = np.empty(n_split, dtype=np.int64)
+    split_type = np.empty(n_split, dtype=np.int64)
+    split_qty = np.empty(n_split, dtype=np.int64)
 
+    i = 0
     for ti, (w, c) in enumerate(zip(weights_u, counts)):
         if w <= 0 or c <= 0:
             continue
         k = 1
         while c > 0:
             take = k if k < c else c
-            split_w.append(w * take)
-            split_type.append(ti)
-            split_qty.append(take)
+            split_w[i] = w * take
+            split_type[i] = ti
+            split_qty[i] = take
+            i += 1
             c -= take
             k *= 2
 
-    if not split_w:
-        return [0] * len(weights_u)
-
-    best = [-1] * (cap_u + 1)
-    best[0] = 0
-    prev_cap = [-1] * (cap_u + 1)
-    prev_item = [-1] * (cap_u + 1)
-
-    for idx, w in enumerate(split_w):
-        for c in range(cap_u, w - 1, -1):
-            b = best[c - w]
-            if b == -1:
-                continue
-            v = b + w
-            if v > best[c]:
-                best[c] = v
-                prev_cap[c] = c - w
-                prev_item[c] = idx
+    if buffers is None or buffers[0].size <= cap_u:
+        buffers = _knapsack_buffers(cap_u)
+    best, prev_cap, prev_item = buffers
+    _knapsack_dp(cap_u, split_w, best, prev_cap, prev_item)
+    best = best[: cap_u + 1]
 
-    best_val = max(best)
+    best_val = int(best.max())
     if best_val <= 0:
         return [0] * len(weights_u)
 
-    c = best.index(best_val)
+    c = int(best.argmax())
     chosen = [0] * len(weights_u)
     while c > 0 and prev_item[c] != -1:
-        idx = prev_item[c]
-        ti = split_type[idx]
-        chosen[ti] += split_qty[idx]
-        c = prev_cap[c]
+        idx = int(prev_item[c])
+        chosen[int(split_type[idx])] += int(split_qty[idx])
+        c = int(prev_cap[c])
 
     return chosen
 
@@ -251,14 +496,24 @@ def _optimize_knapsack_then_greedy(stock: List[StockItem], parts: List[PartItem]
     available_stock_u.sort()
 
     # Aggregate parts by (length,label) so the DP stays small.
-    expanded = _expand_parts(parts)
-    counts: Counter[tuple[int, str]] = Counter((p.length_u, p.label) for p in expanded)
+    counts: Dict[Tuple[int, str], int] = {}
+    for p in parts:
+        if p.qty > 0 and p.length_mm > 0:
+            key = (mm_to_u(p.length_mm), sys.intern(p.label or ""))
+            counts[key] = counts.get(key, 0) + p.qty
 
     plans: List[StickPlan] = []
 
     small_threshold_u = SMALL_STOCK_KNAPSACK_MAX_MM * SCALE
     remaining_stock_u: List[int] = []
 
+    # The DP tables are shared by every short stick, and a stick length that has
+    # already been solved against the same counts (e.g. a run of sticks that nothing
+    # fits) reuses the answer.
+    small_caps = [L + kerf_u for L in available_stock_u if L <= small_threshold_u]
+    buffers = _knapsack_buffers(max(small_caps)) if small_caps else None
+    solved: Dict[Tuple[int, Tuple[Tuple[Tuple[int, str], int], ...]], List[int]] = {}
+
     # First, pack short sticks optimally.
     for L in available_stock_u:
         if L > small_threshold_u:
@@ -274,7 +529,13 @@ def _optimize_knapsack_then_greedy(stock: List[StockItem], parts: List[PartItem]
         type_weights = [k[0] + kerf_u for k in type_keys]  # transform: add kerf to each part
         cap_u = L + kerf_u  # transformed capacity
 
-        chosen = _bounded_knapsack_max_fill(cap_u=cap_u, weights_u=type_weights, counts=type_counts)
+        memo_key = (cap_u, tuple(counts.items()))
+        chosen = solved.get(memo_key)
+        if chosen is None:
+            chosen = _bounded_knapsack_max_fill(
+                cap_u=cap_u, weights_u=type_weights, counts=type_counts, buffers=buffers
+            )
+            solved[memo_key] = chosen
         if not any(chosen):
             # Nothing fits; keep this stock for the greedy stage.
             remaining_stock_u.append(L)
@@ -293,13 +554,19 @@ def _optimize_knapsack_then_greedy(stock: List[StockItem], parts: List[PartItem]
 
         plans.append(StickPlan(stock_length_u=L, parts=stick_parts))
 
-    # Re-expand remaining parts for the greedy stage.
-    remaining_parts: List[PartInstance] = []
-    for (length_u, label), qty in counts.items():
-        remaining_parts.extend([PartInstance(length_u=length_u, label=label)] * qty)
-    remaining_parts.sort(key=lambda p: p.length_u, reverse=True)
-
-    unallocated = _place_parts_greedy(plans=plans, available_stock_u=remaining_stock_u, parts_sorted_desc=remaining_parts, kerf_u=kerf_u)
+    # The remaining counts go to the greedy stage as rows, longest first.
+    lengths_u, qty, label_ids, labels = _count_rows(counts)
+    lengths_u, qty, label_ids = _sort_desc(lengths_u, qty, label_ids)
+
+    unallocated = _place_parts_greedy(
+        plans=plans,
+        available_stock_u=remaining_stock_u,
+        lengths_u=lengths_u,
+        qty=qty,
+        label_ids=label_ids,
+        labels=labels,
+        kerf_u=kerf_u,
+    )
     return _build_result(plans=plans, unallocated=unallocated, kerf_u=kerf_u)
 
 def optimize_cut_order(stock: List[StockItem], parts: List[PartItem], kerf_mm: float) -> OptimizeResult:
@@ -319,18 +586,32 @@ def optimize_cut_order(stock: List[StockItem], parts: List[PartItem], kerf_mm: f
     kerf_u = int(round(float(kerf_mm) * SCALE))
 
     # Fast baseline (existing heuristic).
-    expanded_parts = _expand_parts(parts)
-    expanded_parts.sort(key=lambda p: p.length_u, reverse=True)
+    lengths_u, qty, label_ids, labels = _part_rows(parts)
+    lengths_u, qty, label_ids = _sort_desc(lengths_u, qty, label_ids)
     available_stock_u = _expand_stock(stock)
+    available_stock_u.sort()
 
     plans: List[StickPlan] = []
-    unallocated = _place_parts_greedy(plans=plans, available_stock_u=available_stock_u, parts_sorted_desc=expanded_parts, kerf_u=kerf_u)
+    unallocated = _place_parts_greedy(
+        plans=plans,
+        available_stock_u=available_stock_u,
+        lengths_u=lengths_u,
+        qty=qty,
+        label_ids=label_ids,
+        labels=labels,
+        kerf_u=kerf_u,
+    )
     baseline = _build_result(plans=plans, unallocated=unallocated, kerf_u=kerf_u)
 
     # If anything is unallocated, attempt a stronger (but still fast) fallback.
     if not baseline.unallocated_parts:
         return baseline
 
+    # Without short sticks the fallback is only the same greedy pass again.
+    small_threshold_u = SMALL_STOCK_KNAPSACK_MAX_MM * SCALE
+    if not any(s.qty > 0 and s.length_mm > 0 and mm_to_u(s.length_mm) <= small_threshold_u for s in stock):
+        return baseline
+
     improved = _optimize_knapsack_then_greedy(stock=stock, parts=parts, kerf_u=kerf_u)
 
     # Pick the better result.
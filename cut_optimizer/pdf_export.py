@@ -1,18 +1,54 @@
+"""PDF cut-plan export.
+
+The plan is a fixed grid, so it is drawn straight onto a reportlab Canvas
+(strings, lines and rects) rather than through Platypus flowables/Table: there
+is no layout pass, and the cost is linear in the number of drawn cells.
+"""
+
 from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Tuple
+from functools import lru_cache
+import sys
+from typing import Any, Dict, Iterable, List, Tuple
 
+import numpy as np
 
-from .optimizer import OptimizeResult, u_to_mm_str
+from .optimizer import OptimizeResult, u_to_mm_str, SCALE
 
-# Lazy imports so the app can run without reportlab until PDF export is used.
-def _string_width(text: str, font_name: str, font_size: float) -> float:
-    from reportlab.pdfbase.pdfmetrics import stringWidth
-    return stringWidth(text, font_name, font_size)
+# Imported once here; io_utils only imports this module when a PDF is exported,
+# so the app can still run without reportlab installed.
+try:
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.pdfbase.pdfmetrics import getFont, stringWidth
+    from reportlab.pdfgen.canvas import Canvas
+except Exception as e:
+    _REPORTLAB_ERROR: Exception | None = e
+else:
+    _REPORTLAB_ERROR = None
 
 
+@lru_cache(maxsize=None)
+def _ascii_widths(font_name: str) -> List[int] | None:
+    # Glyph advances (1/1000 em) for codes 0-127, or None if the font can't use them.
+    font = getFont(font_name)
+    if getattr(font, "substitutionFonts", None) or not hasattr(font, "widths"):
+        return None
+    return list(font.widths[:128])
+
+
+@lru_cache(maxsize=16384)
+def _string_width(text: str, font_name: str, font_size: float) -> float:
+    # Cached: _truncate measures prefixes of the same strings, and cut plans repeat
+    # the same lengths and labels across sticks and pages.
+    widths = _ascii_widths(font_name) if text.isascii() else None
+    if widths is None:
+        return stringWidth(text, font_name, font_size)
+    # ASCII maps 1:1 onto the standard fonts' single-byte encoding, so this is
+    # reportlab's own sum-of-advances, minus its per-call encoding dispatch.
+    return sum(map(widths.__getitem__, text.encode("ascii"))) * 0.001 * font_size
+
 
 @dataclass
 class _PageLayout:
@@ -33,69 +69,147 @@ class _PageLayout:
     pad_y: float
 
 
+def _measure_texts(texts: Iterable[str], font_name: str, font_size: float) -> Dict[str, float]:
+    """Widths of many non-empty strings at once.
+
+    ASCII strings are measured in one pass: their bytes are concatenated, mapped
+    through the font's width table and summed per string with np.add.reduceat. The
+    integer sums and the final scaling are the same operations _string_width does,
+    so the results are identical. Anything else goes through _string_width.
+    """
+    widths = _ascii_widths(font_name)
+    out: Dict[str, float] = {}
+    ascii_texts: List[str] = []
+    for t in texts:
+        if widths is not None and t.isascii():
+            ascii_texts.append(t)
+        else:
+            out[t] = _string_width(t, font_name, font_size)
+    if ascii_texts:
+        lut = np.asarray(widths, dtype=np.int64)
+        codes = np.frombuffer("".join(ascii_texts).encode("ascii"), dtype=np.uint8)
+        starts = np.zeros(len(ascii_texts), dtype=np.int64)
+        np.cumsum([len(t) for t in ascii_texts[:-1]], out=starts[1:])
+        sums = np.add.reduceat(lut[codes], starts)
+        out.update(zip(ascii_texts, (sums * 0.001 * font_size).tolist()))
+    return out
+
+
 def _clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
+@lru_cache(maxsize=4096)
 def _truncate(text: str, font_name: str, font_size: float, max_w: float) -> str:
     """Truncate a string with ellipsis to fit within max_w points."""
+    # Cached on the exact max_w: a column keeps its width on every page, so headers
+    # and repeated labels are only truncated once. Rounding max_w for more hits
+    # could move the cut point by a character near the boundary.
     if not text:
         return ""
-    if _string_width(text, font_name, font_size) <= max_w:
+    full_w = _string_width(text, font_name, font_size)
+    if full_w <= max_w:
         return text
     ell = "..."
-    if _string_width(ell, font_name, font_size) >= max_w:
+    ell_w = _string_width(ell, font_name, font_size)
+    if ell_w >= max_w:
         return ""
-    # Binary search a cut length
-    lo, hi = 0, len(text)
-    while lo < hi:
-        mid = (lo + hi) // 2
-        cand = text[:mid] + ell
-        if _string_width(cand, font_name, font_size) <= max_w:
-            lo = mid + 1
-        else:
-            hi = mid
-    return text[: max(0, lo - 1)] + ell
+    # Keep the longest prefix k with text[:k] + ell inside max_w.
+    widths = _ascii_widths(font_name) if text.isascii() else None
+    if widths is not None:
+        # Walk the running width in font units, with the same arithmetic as
+        # _string_width so the boundary is exactly where measuring would put it.
+        total = 3 * widths[ord(".")]
+        k = 0
+        for code in text.encode("ascii"):
+            total += widths[code]
+            if total * 0.001 * font_size > max_w:
+                break
+            k += 1
+        return text[:k] + ell
+
+    # Otherwise start from a proportional guess (Helvetica is close enough to even
+    # widths for it to land within a character or two), then step to the boundary.
+    k = min(len(text) - 1, int(len(text) * (max_w - ell_w) / full_w))
+    if _string_width(text[:k] + ell, font_name, font_size) <= max_w:
+        while k + 1 < len(text) and _string_width(text[: k + 1] + ell, font_name, font_size) <= max_w:
+            k += 1
+    else:
+        k -= 1
+        while k > 0 and _string_width(text[:k] + ell, font_name, font_size) > max_w:
+            k -= 1
+    return text[:k] + ell
+
+
+def _partition_blocks(col_widths: List[float], usable_w: float) -> List[Tuple[int, int]]:
+    """Split the stick columns into (start, end) runs that fit across the page.
+
+    Greedy: each block takes columns until the next would overflow usable_w, and
+    always at least one so a too-wide column still gets a block of its own.
+    """
+    # One pass: the running width restarts at each column that opens a new block.
+    blocks: List[Tuple[int, int]] = []
+    col_start = 0
+    w_sum = 0.0
+    for col_end, w in enumerate(col_widths):
+        if col_end > col_start and (w_sum + w) > usable_w:
+            blocks.append((col_start, col_end))
+            col_start = col_end
+            w_sum = 0.0
+        w_sum += w
+    if col_widths:
+        blocks.append((col_start, len(col_widths)))
+    return blocks
 
 
 def _measure_col_width(
     header1: str,
     header2: str,
-    cells: List[Tuple[str, str]],
+    lengths: List[str],
+    labels: List[str],
     *,
-    font_name: str,
+    text_widths: Dict[str, float],
     font_bold: str,
     font_size: float,
     pad_x: float,
     min_col_w: float,
     max_col_w: float,
-) -> float:
+) -> Tuple[float, bool]:
+    """Column width for one stick, and whether any of its text can overflow it.
+
+    lengths and labels are the stick's cell strings; text_widths holds the pre-measured
+    regular-font width of every header2/cell string.
+    The flag is False when the widest string fits the width _draw_block gives it
+    (col_w - 2 * pad_x), so none of the column's strings need _truncate.
+    """
     widths: List[float] = []
 
     if header1:
         widths.append(_string_width(header1, font_bold, font_size))
     if header2:
-        widths.append(_string_width(header2, font_name, font_size))
+        widths.append(text_widths[header2])
 
-    for a, b in cells:
-        if a:
-            widths.append(_string_width(a, font_name, font_size))
-        if b:
-            widths.append(_string_width(b, font_name, font_size))
+    # Every string is already measured, so the exact max costs one lookup per distinct
+    # string; sticks repeat lengths and labels, so the sets are usually short.
+    widths.extend(text_widths[t] for t in set(lengths) if t)
+    widths.extend(text_widths[t] for t in set(labels) if t)
 
-    required = (max(widths) if widths else 0.0) + 2 * pad_x
-    return _clamp(required, min_col_w, max_col_w)
+    widest = max(widths) if widths else 0.0
+    col_w = _clamp(widest + 2 * pad_x, min_col_w, max_col_w)
+    return col_w, widest > col_w - 2 * pad_x
 
 
 def export_plan_pdf(
     path: str,
     result: OptimizeResult,
-    kerf_mm: float,
     *,
+    kerf_u: int,
     title: str = "Cut plan",
 ) -> None:
     """Export the cut plan as a multi-page PDF.
 
+    kerf_u is the kerf in internal 0.1mm units (mm_to_u(kerf_mm)), not mm.
+
     Layout:
       - Cuts listed vertically (rows)
       - Sticks listed horizontally (columns)
@@ -107,14 +221,17 @@ def export_plan_pdf(
     actual label/length text width.
     """
 
-    try:
-        from reportlab.lib.pagesizes import A4, landscape
-        from reportlab.pdfgen.canvas import Canvas
-    except Exception as e:
+    if _REPORTLAB_ERROR is not None:
         raise RuntimeError(
             "PDF export requires the 'reportlab' package. Install it with: pip install reportlab"
-        ) from e
+        ) from _REPORTLAB_ERROR
 
+    kerf_mm = kerf_u / SCALE
+    # One timestamp for the whole document, shown in every page header.
+    generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    # No BytesIO needed: the Canvas keeps the document in memory and save() writes the
+    # finished bytes to path in a single write.
     c = Canvas(path, pagesize=landscape(A4))
     page_w, page_h = landscape(A4)
 
@@ -150,27 +267,29 @@ def export_plan_pdf(
     plans = result.plans
     stick_count = len(plans)
 
-    # Pre-rendered text for each stick's cuts.
-    stick_headers: List[Tuple[str, str]] = []  # (line1, line2)
-    stick_cells: List[List[Tuple[str, str]]] = []  # [(len_mm, label), ...]
-    max_rows_total = 0
-
-    for i, plan in enumerate(plans, start=1):
-        stock_mm = u_to_mm_str(plan.stock_length_u)
-        stick_headers.append((f"Stick {i}", f"({stock_mm})"))
-
-        cells: List[Tuple[str, str]] = []
+    # Pre-rendered text for each stick's cuts. This runs once, serially: it is pure
+    # Python string work (GIL-bound) and the Canvas itself is not thread-safe.
+    stick_headers: List[Tuple[str, str]] = [
+        (f"Stick {i}", f"({u_to_mm_str(plan.stock_length_u)})") for i, plan in enumerate(plans, start=1)
+    ]  # (line1, line2)
+    # u_to_mm_str is cached, so equal lengths already share one string; labels are
+    # interned after strip() for the same effect. The column-width cache keys on
+    # these strings, and identical objects compare without touching the characters.
+    # Stored flat: stick j's cuts are cell_lengths/cell_labels[stick_offsets[j]:stick_offsets[j + 1]].
+    cell_lengths: List[str] = []
+    cell_labels: List[str] = []
+    stick_offsets: List[int] = [0]
+    for plan in plans:
         for p in plan.parts:
-            length_mm = u_to_mm_str(p.length_u)
-            label = (p.label or "").strip()
-            cells.append((length_mm, label))
-
-        stick_cells.append(cells)
-        max_rows_total = max(max_rows_total, len(cells))
+            cell_lengths.append(u_to_mm_str(p.length_u))
+            cell_labels.append(sys.intern((p.label or "").strip()))
+        stick_offsets.append(len(cell_lengths))
+    stick_counts = [b - a for a, b in zip(stick_offsets, stick_offsets[1:])]
+    max_rows_total = max(stick_counts, default=0)
 
     # If there are no plans, still create a PDF with a header.
     if stick_count == 0:
-        _draw_page_header(c, layout, title, kerf_mm, page_no=1)
+        _draw_page_header(c, layout, title, kerf_mm, generated, page_no=1)
         c.setFont(font_name, 12)
         c.drawString(layout.margin, layout.page_h - layout.margin - layout.header_area_h, "(No sticks in plan)")
         c.showPage()
@@ -179,48 +298,52 @@ def export_plan_pdf(
 
     # If there are sticks but no cuts at all.
     if max_rows_total == 0:
-        _draw_page_header(c, layout, title, kerf_mm, page_no=1)
+        _draw_page_header(c, layout, title, kerf_mm, generated, page_no=1)
         c.setFont(font_name, 12)
         c.drawString(layout.margin, layout.page_h - layout.margin - layout.header_area_h, "(No cuts in plan)")
         c.showPage()
         c.save()
         return
 
-    # Compute a per-stick column width based on the actual text.
+    # Lengths, labels and stock sizes repeat across sticks, so measure each distinct
+    # regular-font string once.
+    unique_text = {h2 for _, h2 in stick_headers}
+    unique_text.update(cell_lengths)
+    unique_text.update(cell_labels)
+    unique_text.discard("")
+    text_widths = _measure_texts(unique_text, font_name, layout.font_size)
+
+    # Compute a per-stick column width based on the actual text. Sticks cut the same
+    # way (same stock, same cuts) share a width; "Stick N" only matters through its
+    # measured width, which is the same for most N (Helvetica digits are even-width).
     col_widths: List[float] = []
-    for (h1, h2), cells in zip(stick_headers, stick_cells):
-        col_w = _measure_col_width(
-            h1,
-            h2,
-            cells,
-            font_name=font_name,
-            font_bold=font_bold,
-            font_size=layout.font_size,
-            pad_x=layout.pad_x,
-            min_col_w=layout.min_col_w,
-            max_col_w=layout.max_col_w,
-        )
-        col_widths.append(col_w)
+    col_truncates: List[bool] = []
+    width_cache: Dict[Tuple[float, str, Tuple[str, ...], Tuple[str, ...]], Tuple[float, bool]] = {}
+    for (h1, h2), start, end in zip(stick_headers, stick_offsets, stick_offsets[1:]):
+        lengths = cell_lengths[start:end]
+        labels = cell_labels[start:end]
+        key = (_string_width(h1, font_bold, layout.font_size), h2, tuple(lengths), tuple(labels))
+        measured = width_cache.get(key)
+        if measured is None:
+            measured = width_cache[key] = _measure_col_width(
+                h1,
+                h2,
+                lengths,
+                labels,
+                text_widths=text_widths,
+                font_bold=font_bold,
+                font_size=layout.font_size,
+                pad_x=layout.pad_x,
+                min_col_w=layout.min_col_w,
+                max_col_w=layout.max_col_w,
+            )
+        col_widths.append(measured[0])
+        col_truncates.append(measured[1])
 
     usable_w = layout.page_w - 2 * layout.margin - layout.index_col_w
 
     # Partition sticks into blocks that fit across the page.
-    blocks: List[Tuple[int, int]] = []
-    col_start = 0
-    while col_start < stick_count:
-        w_sum = 0.0
-        col_end = col_start
-        while col_end < stick_count:
-            w = col_widths[col_end]
-            if col_end > col_start and (w_sum + w) > usable_w:
-                break
-            w_sum += w
-            col_end += 1
-        # Always make progress.
-        if col_end == col_start:
-            col_end = col_start + 1
-        blocks.append((col_start, col_end))
-        col_start = col_end
+    blocks = _partition_blocks(col_widths, usable_w)
 
     top_y = layout.page_h - layout.margin - layout.header_area_h
     bottom_y = layout.margin + layout.footer_area_h
@@ -230,23 +353,23 @@ def export_plan_pdf(
     max_rows_fit = max(1, int((usable_h - layout.header_row_h) / layout.row_h))
     rows_per_slice = min(max_rows_total, max_rows_fit)
 
+    # A block runs as deep as its longest stick; fixed per block, so found once here.
+    block_rows = [max(stick_counts[b_start:b_end]) for b_start, b_end in blocks]
+
     page_no = 1
     row_start = 0
     while row_start < max_rows_total:
         row_end = min(max_rows_total, row_start + rows_per_slice)
 
-        _draw_page_header(c, layout, title, kerf_mm, page_no=page_no, row_range=(row_start + 1, row_end))
+        _draw_page_header(c, layout, title, kerf_mm, generated, page_no=page_no, row_range=(row_start + 1, row_end))
         y_cursor = top_y
 
-        for b_start, b_end in blocks:
+        for (b_start, b_end), block_len in zip(blocks, block_rows):
             # Only render as many rows as are needed for this *block* of sticks.
             # Previously we always used the global row slice height (row_end-row_start),
             # which created lots of empty rows when some sticks in the block had fewer cuts.
             # This in turn reduced how many blocks could fit on a page and increased page count.
-            rows_needed = 0
-            for stick_list in stick_cells[b_start:b_end]:
-                if len(stick_list) > row_start:
-                    rows_needed = max(rows_needed, min(row_end, len(stick_list)) - row_start)
+            rows_needed = min(row_end, block_len) - row_start
 
             # If every stick in this block is exhausted for this row slice, skip it.
             if rows_needed <= 0:
@@ -264,6 +387,7 @@ def export_plan_pdf(
                     layout,
                     title,
                     kerf_mm,
+                    generated,
                     page_no=page_no,
                     row_range=(row_start + 1, row_end),
                 )
@@ -275,8 +399,11 @@ def export_plan_pdf(
                 x0=layout.margin,
                 y_top=y_cursor,
                 headers=stick_headers[b_start:b_end],
-                cells=stick_cells[b_start:b_end],
+                cell_lengths=cell_lengths,
+                cell_labels=cell_labels,
+                offsets=stick_offsets[b_start : b_end + 1],
                 col_widths=col_widths[b_start:b_end],
+                col_truncates=col_truncates[b_start:b_end],
                 row_start=row_start,
                 row_end=block_row_end,
             )
@@ -297,6 +424,7 @@ def _draw_page_header(
     layout: _PageLayout,
     title: str,
     kerf_mm: float,
+    generated: str,
     *,
     page_no: int,
     row_range: Tuple[int, int] | None = None,
@@ -308,7 +436,7 @@ def _draw_page_header(
     meta = f"Kerf: {kerf_mm:.1f} mm"
     if row_range is not None:
         meta += f"   Cuts: {row_range[0]}-{row_range[1]}"
-    meta += f"   Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    meta += f"   Generated: {generated}"
 
     # Truncate the title if needed so it doesn't collide with the right-aligned meta text.
     meta_w = _string_width(meta, "Helvetica", 9)
@@ -333,82 +461,132 @@ def _draw_block(
     x0: float,
     y_top: float,
     headers: List[Tuple[str, str]],
-    cells: List[List[Tuple[str, str]]],
+    cell_lengths: List[str],
+    cell_labels: List[str],
+    offsets: List[int],
     col_widths: List[float],
+    col_truncates: List[bool],
     row_start: int,
     row_end: int,
 ) -> None:
-    """Draw one block of columns (sticks) for a given row slice."""
+    """Draw one block of columns (sticks) for a given row slice.
+
+    Column j's cuts are cell_lengths/cell_labels[offsets[j]:offsets[j + 1]]. Text is
+    only run through _truncate in columns flagged in col_truncates.
+    """
 
     font_name = "Helvetica"
     font_bold = "Helvetica-Bold"
+    # Layout values as locals: the body loop below runs once per drawn cell.
     font_size = layout.font_size
+    index_col_w = layout.index_col_w
+    header_row_h = layout.header_row_h
+    row_h = layout.row_h
+    line_h = layout.line_h
+    pad_x = layout.pad_x
+    pad_y = layout.pad_y
+
+    # All of the block's text goes into one text object, positioned absolutely per
+    # string: one BT/ET pair instead of one per drawString, and no stringWidth call
+    # per string (drawString measures every string it draws).
+    text = c.beginText()
+    move_to = text.setTextOrigin
+    draw = text.textLine
+
+    # setFont writes a Tf operator every time, so only switch when the font changes;
+    # nearly the whole body is drawn in the regular font.
+    current_font = None
+
+    def use_font(name: str) -> None:
+        nonlocal current_font
+        if name != current_font:
+            text.setFont(name, font_size)
+            current_font = name
 
     rows = row_end - row_start
-    cols = len(headers)
 
-    total_w = layout.index_col_w + sum(col_widths)
-    total_h = layout.header_row_h + rows * layout.row_h
+    total_w = index_col_w + sum(col_widths)
+    total_h = header_row_h + rows * row_h
 
     y0 = y_top - total_h
 
+    # Per-column left edges and text widths, computed once for the header and every row.
+    x_lefts: List[float] = []
+    x_cursor = x0 + index_col_w
+    for w in col_widths:
+        x_lefts.append(x_cursor)
+        x_cursor += w
+    max_ws = [w - 2 * pad_x for w in col_widths]
+
     # Outer box
     c.setLineWidth(0.6)
     c.rect(x0, y0, total_w, total_h)
 
-    # Vertical grid lines
+    # Interior grid: one stroked path for all the lines.
     c.setLineWidth(0.4)
-    x = x0 + layout.index_col_w
-    c.line(x, y0, x, y_top)
-    x_cursor = x
-    for w in col_widths:
-        x_cursor += w
-        c.line(x_cursor, y0, x_cursor, y_top)
+    grid = c.beginPath()
+
+    # Vertical grid lines: every column's left edge, plus the right edge of the last.
+    for x in x_lefts + [x_cursor]:
+        grid.moveTo(x, y0)
+        grid.lineTo(x, y_top)
 
     # Horizontal grid lines
-    y = y_top - layout.header_row_h
-    c.line(x0, y, x0 + total_w, y)
+    y = y_top - header_row_h
+    grid.moveTo(x0, y)
+    grid.lineTo(x0 + total_w, y)
     for i in range(rows):
-        y = y_top - layout.header_row_h - (i + 1) * layout.row_h
-        c.line(x0, y, x0 + total_w, y)
+        y = y_top - header_row_h - (i + 1) * row_h
+        grid.moveTo(x0, y)
+        grid.lineTo(x0 + total_w, y)
+
+    c.drawPath(grid, stroke=1, fill=0)
 
     # Header: Cut #
-    c.setFont(font_bold, font_size)
-    header_y1 = y_top - layout.pad_y - font_size
-    c.drawString(x0 + layout.pad_x, header_y1, "Cut")
+    use_font(font_bold)
+    header_y1 = y_top - pad_y - font_size
+    move_to(x0 + pad_x, header_y1)
+    draw("Cut")
 
     # Stick headers
-    x_left = x0 + layout.index_col_w
-    for j, ((h1, h2), w) in enumerate(zip(headers, col_widths)):
-        max_w = w - 2 * layout.pad_x
-        c.setFont(font_bold, font_size)
-        c.drawString(x_left + layout.pad_x, header_y1, _truncate(h1, font_bold, font_size, max_w))
+    for (h1, h2), x_left, max_w, trunc in zip(headers, x_lefts, max_ws, col_truncates):
+        use_font(font_bold)
+        move_to(x_left + pad_x, header_y1)
+        draw(_truncate(h1, font_bold, font_size, max_w) if trunc else h1)
         if h2:
-            c.setFont(font_name, font_size)
-            header_y2 = header_y1 - layout.line_h
-            c.drawString(x_left + layout.pad_x, header_y2, _truncate(h2, font_name, font_size, max_w))
-        x_left += w
-
-    # Body cells (two-line: length then label)
+            use_font(font_name)
+            header_y2 = header_y1 - line_h
+            move_to(x_left + pad_x, header_y2)
+            draw(_truncate(h2, font_name, font_size, max_w) if trunc else h2)
+
+    # Body cells (two-line: length then label), all in the regular font.
+    counts = [end - start for start, end in zip(offsets, offsets[1:])]
+    columns = list(zip(offsets, counts, [x + pad_x for x in x_lefts], max_ws, col_truncates))
+    use_font(font_name)
     for i in range(rows):
         cut_idx = row_start + i
-        row_top = y_top - layout.header_row_h - i * layout.row_h
-        line1_y = row_top - layout.pad_y - font_size
-        line2_y = line1_y - layout.line_h
-
-        # Cut index column
-        c.setFont(font_name, font_size)
-        c.drawRightString(x0 + layout.index_col_w - layout.pad_x, line1_y, str(cut_idx + 1))
-
-        x_left = x0 + layout.index_col_w
-        for stick_list, w in zip(cells, col_widths):
-            max_w = w - 2 * layout.pad_x
-            if cut_idx < len(stick_list):
-                length_mm, label = stick_list[cut_idx]
+        row_top = y_top - header_row_h - i * row_h
+        line1_y = row_top - pad_y - font_size
+        line2_y = line1_y - line_h
+
+        # Cut index column, right-aligned the way drawRightString does it.
+        cut_no = str(cut_idx + 1)
+        move_to(x0 + index_col_w - pad_x - _string_width(cut_no, font_name, font_size), line1_y)
+        draw(cut_no)
+
+        for start, count, x_text, max_w, trunc in columns:
+            if cut_idx < count:
+                length_mm = cell_lengths[start + cut_idx]
+                label = cell_labels[start + cut_idx]
                 if length_mm:
-                    c.setFont(font_name, font_size)
-                    c.drawString(x_left + layout.pad_x, line1_y, _truncate(length_mm, font_name, font_size, max_w))
+                    if trunc:
+                        length_mm = _truncate(length_mm, font_name, font_size, max_w)
+                    move_to(x_text, line1_y)
+                    draw(length_mm)
                 if label:
-                    c.setFont(font_name, font_size)
-                    c.drawString(x_left + layout.pad_x, line2_y, _truncate(label, font_name, font_size, max_w))
-            x_left += w
+                    if trunc:
+                        label = _truncate(label, font_name, font_size, max_w)
+                    move_to(x_text, line2_y)
+                    draw(label)
+
+    c.drawText(text)
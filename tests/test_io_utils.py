@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from cut_optimizer.io_utils import load_parts_table, load_stock_table
+
+
+def _write_csv(path, header, rows):
+    path.write_text("\n".join(",".join(map(str, r)) for r in [header, *rows]) + "\n")
+
+
+def test_csv_column_type_changes_after_sampled_rows(tmp_path):
+    parts = tmp_path / "parts.csv"
+    _write_csv(parts, ("part_length", "qty", "label"), [(100 + i, 1, i) for i in range(150)] + [(1234.5, 2, "A-12")])
+    loaded = load_parts_table(str(parts))
+    assert len(loaded) == 151
+    assert (loaded[0].length_mm, loaded[0].label) == (100.0, "0")
+    assert (loaded[-1].length_mm, loaded[-1].qty, loaded[-1].label) == (1234.5, 2, "A-12")
+
+    stock = tmp_path / "stock.csv"
+    _write_csv(stock, ("stock_length", "qty"), [(6000, 1)] * 120 + [(5800.5, 3)])
+    loaded = load_stock_table(str(stock))
+    assert (loaded[-1].length_mm, loaded[-1].qty) == (5800.5, 3)
+
+
+def test_xlsx_label_type_changes_after_sampled_rows(tmp_path):
+    parts = tmp_path / "parts.xlsx"
+    labels = list(range(1300)) + ["A-12"]
+    pd.DataFrame({"part_length": [500] * len(labels), "qty": [1] * len(labels), "label": labels}).to_excel(
+        parts, index=False
+    )
+    loaded = load_parts_table(str(parts))
+    assert len(loaded) == 1301
+    assert [p.label for p in loaded[:2]] == ["0", "1"]
+    assert loaded[-1].label == "A-12"
+
+
+def test_csv_padded_blank_and_invalid_cells(tmp_path):
+    parts = tmp_path / "parts.csv"
+    parts.write_text("part_length,qty,label\n 250.25 , 2 ,Rail\n,1,\n")
+    loaded = load_parts_table(str(parts))
+    assert [(p.length_mm, p.qty, p.label) for p in loaded] == [(250.5, 2, "Rail"), (0.0, 1, "")]
+
+    parts.write_text("part_length,qty\n12x,1\n")
+    with pytest.raises(ValueError, match="Invalid part_length value: '12x'"):
+        load_parts_table(str(parts))
+
+
+def test_csv_blank_lines_and_na_tokens(tmp_path):
+    stock = tmp_path / "stock.csv"
+    stock.write_text("stock_length,qty\n6000,1\n\n7200,2\n\n")
+    assert [(s.length_mm, s.qty) for s in load_stock_table(str(stock))] == [(6000.0, 1), (7200.0, 2)]
+
+    parts = tmp_path / "parts.csv"
+    parts.write_text("part_length,qty,label\n100,1,A\n200,2,NA\n300,1,None\nNaN,1,x\n")
+    loaded = load_parts_table(str(parts))
+    assert [(p.length_mm, p.qty, p.label) for p in loaded] == [
+        (100.0, 1, "A"),
+        (200.0, 2, ""),
+        (300.0, 1, ""),
+        (0.0, 1, "x"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "row, field",
+    [
+        ("inf,1", "stock_length"),
+        ("1e400,1", "stock_length"),
+        ("6000,inf", "qty"),
+        ("6000,1e20", "qty"),
+        ("6000,", "qty"),
+    ],
+)
+def test_csv_non_finite_and_out_of_range_values(tmp_path, row, field):
+    stock = tmp_path / "stock.csv"
+    stock.write_text(f"stock_length,qty\n{row}\n")
+    with pytest.raises(ValueError, match=f"Invalid {field} value"):
+        load_stock_table(str(stock))
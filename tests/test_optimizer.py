@@ -0,0 +1,56 @@
+from cut_optimizer.optimizer import PartInstance, PartItem, StickPlan, StockItem, optimize_cut_order
+
+
+def _plans(result):
+    return [(p.stock_length_u, [(x.length_u, x.label) for x in p.parts]) for p in result.plans]
+
+
+def test_add_many_keeps_running_length():
+    plan = StickPlan(stock_length_u=60000)
+    plan.add(PartInstance(length_u=10000))
+    plan.add_many(PartInstance(length_u=2500, label="A"), 3)
+    assert len(plan.parts) == 4
+    assert plan.used_u(kerf_u=28) == 10000 + 3 * 2500 + 3 * 28
+    assert plan.used_u(kerf_u=28) == StickPlan(stock_length_u=60000, parts=plan.parts).used_u(kerf_u=28)
+
+
+def test_row_spread_over_several_sticks():
+    result = optimize_cut_order([StockItem(6000, 3)], [PartItem(2500, 5, "A")], kerf_mm=3.0)
+    a = (25000, "A")
+    assert _plans(result) == [(60000, [a, a]), (60000, [a, a]), (60000, [a])]
+    assert result.unallocated_parts == []
+    assert result.summary["total_kerf_loss_mm"] == 6.0
+
+
+def test_zero_kerf_fills_stick_exactly():
+    result = optimize_cut_order([StockItem(6000, 2)], [PartItem(1500, 5)], kerf_mm=0.0)
+    p = (15000, "")
+    assert _plans(result) == [(60000, [p, p, p, p]), (60000, [p])]
+    assert result.summary["total_leftover_mm"] == 4500.0
+
+
+def test_unallocated_remainder():
+    result = optimize_cut_order(
+        [StockItem(6000, 1)], [PartItem(7000, 1, "long"), PartItem(2000, 4, "B")], kerf_mm=3.0
+    )
+    b = (20000, "B")
+    assert _plans(result) == [(60000, [b, b])]
+    assert [(p.length_u, p.label) for p in result.unallocated_parts] == [(70000, "long"), b, b]
+    assert result.summary["unallocated_count"] == 3.0
+
+
+def test_full_sticks_are_retired_without_changing_placement():
+    # Every "big" stick fills up once it takes an "s", and the "mid" stick once it
+    # takes two; most sticks are retired (and compacted away) before the "t" row.
+    result = optimize_cut_order(
+        [StockItem(6000, 8), StockItem(7200, 2)],
+        [PartItem(5500, 6, "big"), PartItem(1200, 4, "mid"), PartItem(450, 9, "s"), PartItem(400, 3, "t")],
+        kerf_mm=2.8,
+    )
+    big, mid, s, t = (55000, "big"), (12000, "mid"), (4500, "s"), (4000, "t")
+    assert _plans(result) == [(60000, [big, s])] * 6 + [
+        (60000, [mid, mid, mid, mid, s, s]),
+        (60000, [s, t, t, t]),
+    ]
+    assert result.unallocated_parts == []
+    assert result.summary["total_kerf_loss_mm"] == 39.2